@@ -11,9 +11,12 @@ made to the parameter values.
    ~ParameterEditor
 """
 
+import functools
+
 from PyQt5 import QtCore
 from PyQt5 import QtWidgets
 
+from .utils import myLoadUi
 from .utils import unsaved_changes_alert_dialog
 
 
@@ -77,8 +80,6 @@ class ParameterEditor(QtWidgets.QWidget):
     ui_file = "param_editor.ui"
 
     def __init__(self, parent, parameters={}):
-        from .utils import myLoadUi
-
         self.parent = parent
         self.parameters = parameters
 
@@ -96,26 +97,29 @@ class ParameterEditor(QtWidgets.QWidget):
         ``QFormLayout`` along with their associated labels.
         """
         self.editors = {}
+        self._changed = {}  # changed widget values, by key
 
-        def checkIfDirty(_v):  # _v (new value) ignored here
-            """If dirty, then widget value(s) are not as provided."""
-            dirty = len(self.changedValues()) > 0
-            self.setDirty(dirty)
-
-        def add_parameter_widget(pitem):
+        def add_parameter_widget(k, pitem):
             editor = pitem.widget_class(self, parameter=pitem)
-            editor.qpw_setup(pitem, checkIfDirty)
+            editor.qpw_setup(pitem, functools.partial(self._onEditorChanged, k, editor))
 
             label = QtWidgets.QLabel(self, text=pitem.label)
             self.form_layout.addRow(label, editor)
             return editor
 
+        # Add all rows before the form is laid out (and painted) again.
+        self.setUpdatesEnabled(False)
+        self.form_layout.setEnabled(False)
+
         # Remember each parameter's editor widget.
         self.editors = {
-            k: add_parameter_widget(pitem) for k, pitem in self.parameters.items()
+            k: add_parameter_widget(k, pitem) for k, pitem in self.parameters.items()
         }
 
-        self.do_reset()  # sets editor widgets to supplied values
+        self.form_layout.setEnabled(True)
+        self.form_layout.invalidate()
+        self.setUpdatesEnabled(True)
+
         self.btn_reset.clicked.connect(self.do_reset)
         self.btn_accept.clicked.connect(self.do_accept)
 
@@ -130,11 +134,23 @@ class ParameterEditor(QtWidgets.QWidget):
         .. note:: Result is always empty dictionary when
            ``dirty==True``.  Use :meth:`~pyQParamWidget.param_editor.ParameterEditor.values()` to get the final values.
         """
-        return {
-            k: editor.qpw_get()
-            for k, editor in self.editors.items()
-            if editor.qpw_isChanged()
-        }
+        # Same order as the parameters, not the order of editing.
+        return {k: self._changed[k] for k in self.editors if k in self._changed}
+
+    def _has_changes(self) -> bool:
+        """Are any editor values changed?  (Without copying them.)"""
+        return len(self._changed) > 0
+
+    def _onEditorChanged(self, key, editor, _v=None):  # _v (new value) ignored here
+        """Compare only this editor's value with its parameter.  Update dirty flag."""
+        value = editor.qpw_get()
+        if value != self.parameters[key].value:
+            self._changed[key] = value
+        else:
+            self._changed.pop(key, None)
+        dirty = self._has_changes()
+        if dirty != self._dirty:  # only update the buttons when state flips
+            self.setDirty(dirty)
 
     def closeEvent(self, event):
         """
@@ -158,10 +174,10 @@ class ParameterEditor(QtWidgets.QWidget):
 
         Called when the *Accept* button is pressed.
         """
-        # print(f"{self.__class__.__name__}.{sys._getframe().f_code.co_name}()")
-        for k, v in self.changedValues().items():
+        for k, v in self._changed.items():
             parm = self.parameters[k]
             parm.value = v  # update
+        self._changed.clear()
         self.setDirty(False)
 
     @QtCore.pyqtSlot()
@@ -171,9 +187,9 @@ class ParameterEditor(QtWidgets.QWidget):
 
         Called when the *Reset* button is pressed.
         """
-        # print(f"{self.__class__.__name__}.{sys._getframe().f_code.co_name}()")
         for k, editor in self.editors.items():
             editor.qpw_set(self.parameters[k].value)
+        self._changed.clear()
         self.setDirty(False)
 
     def dirty(self) -> bool:
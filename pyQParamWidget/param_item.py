@@ -22,16 +22,16 @@ __all__ = """
 
 from dataclasses import KW_ONLY
 from dataclasses import dataclass
+from typing import ClassVar
 from typing import List
 
-from .qpw_widgets import UNDEFINED_VALUE
 from .qpw_widgets import QPW_CheckBox
 from .qpw_widgets import QPW_Choice
 from .qpw_widgets import QPW_SpinBox
 from .qpw_widgets import QPW_Text
 
 
-@dataclass()
+@dataclass(slots=True)
 class ParameterItemBase:
     """
     Each parameter to be edited has several pieces of information.
@@ -52,15 +52,29 @@ class ParameterItemBase:
     tooltip: str = ""
     """Widget tooltip for this item."""
 
-    choices: List[str] = UNDEFINED_VALUE
+    choices: List[str] | None = None
     """List of choices for QPW_Choice widget."""
 
-    hi: int = UNDEFINED_VALUE
+    hi: int | None = None
     """Maximum value for QPW_SpinBox widget."""
 
-    lo: int = UNDEFINED_VALUE
+    lo: int | None = None
     """Minimum value for QPW_SpinBox widget."""
 
+    _needs_validation: ClassVar[bool] = True
+    """
+    Subclasses with nothing to validate set this to ``False``.
+
+    A subclass that defines its own ``validate`` method is reset to
+    ``True`` unless it also sets this flag itself.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        # Named explicitly: slots=True replaces this class.
+        super(ParameterItemBase, cls).__init_subclass__(**kwargs)
+        if "validate" in cls.__dict__ and "_needs_validation" not in cls.__dict__:
+            cls._needs_validation = True
+
     def validate(self):
         """
         Each subclass must define a ``validate`` method that
@@ -83,15 +97,17 @@ class ParameterItemBase:
         The ``__post_init__`` method is called
         after initializing the object to validate the inputs.
         """
-        # print(f"{self.__class__.__name__}.{sys._getframe().f_code.co_name}()")
-
-        self.validate()
+        if self._needs_validation:
+            self.validate()
 
 
 class ParameterItemCheckbox(ParameterItemBase):
     """Edit a checkbox parameter where the value is either ``True`` or ``False``."""
 
+    __slots__ = ()
+
     widget_class = QPW_CheckBox
+    _needs_validation = False
 
     def __init__(self, label, value, tooltip=""):
         super().__init__(label, value, tooltip=tooltip)
@@ -104,6 +120,8 @@ class ParameterItemCheckbox(ParameterItemBase):
 class ParameterItemChoice(ParameterItemBase):
     """Choose a parameter value from a list of choices."""
 
+    __slots__ = ()
+
     widget_class = QPW_Choice
 
     def __init__(self, label, value, choices=[], tooltip=""):
@@ -111,42 +129,45 @@ class ParameterItemChoice(ParameterItemBase):
 
     def validate(self):
         """Must provide a list of choices."""
-        if self.choices == UNDEFINED_VALUE:
+        if self.choices is None:
             raise ValueError('Must be list of choices: \'choices=["one", "two", ...]\'')
 
 
 class ParameterItemSpinBox(ParameterItemBase):
     """Set a numerical parameter between lo & hi."""
 
+    __slots__ = ()
+
     widget_class = QPW_SpinBox
 
     def __init__(
         self,
         label: str,
         value: int,
-        hi: int = UNDEFINED_VALUE,
-        lo: int = UNDEFINED_VALUE,
+        hi: int | None = None,
+        lo: int | None = None,
         tooltip: str = "",
     ):
         super().__init__(label, value, tooltip=tooltip, hi=hi, lo=lo)
 
     def validate(self):
         """Must provide lo <= value <= hi."""
-        if self.hi == UNDEFINED_VALUE:
+        if self.hi is None:
             raise ValueError("Must provide hi (maximum value), example: 'hi=9'")
-        if self.lo == UNDEFINED_VALUE:
+        if self.lo is None:
             raise ValueError("Must provide lo (minimum value), example: 'lo=0'")
         if self.lo > self.hi:
             raise ValueError(
                 f"Received 'lo={self.lo}' which is greater than 'hi={self.hi}'."
             )
+        value = int(self.value)
         # fmt: off
-        if int(self.value) > self.hi:
+        if value > self.hi:
             raise ValueError(
                 f"Received 'value={self.value}."
                 f"  Cannot be greater than: hi={self.hi}'."
             )
-        if int(self.value) < self.lo:
+        if value < self.lo:
             raise ValueError(
                 f"Received 'value={self.value}."
                 f"  Cannot be less than: lo={self.lo}'."
@@ -157,7 +178,10 @@ class ParameterItemSpinBox(ParameterItemBase):
 class ParameterItemText(ParameterItemBase):
     """Edit a text parameter where any text can be entered."""
 
+    __slots__ = ()
+
     widget_class = QPW_Text
+    _needs_validation = False
 
     def __init__(self, label, value, tooltip=""):
         super().__init__(label, value, tooltip=tooltip)
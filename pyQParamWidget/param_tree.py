@@ -8,10 +8,12 @@ Parameter Tree: dialog for hierachy of user-editable application parameters.
 
 from uuid import uuid4
 
+from PyQt5 import QtCore
 from PyQt5 import QtWidgets
 
 from .param_editor import ParameterEditor
 from .param_item import ParameterItemBase
+from .utils import myLoadUi
 from .utils import unsaved_changes_alert_dialog
 
 
@@ -24,13 +26,20 @@ class ParameterTree(QtWidgets.QDialog):
     - parameters (dict): Dictionary of :ref:`guide.ParameterItem`.
     - headings ([str]): table headings
       (Only for diagnostic purposes, use ``headings=["heading", "uid"]``.)
+
+    .. note:: Branches of the tree are built when first expanded.
+
+       Until a branch is expanded, its items do not exist:
+       ``tree.findItems()`` (even with ``MatchRecursive``),
+       ``item.child()``, ``QTreeWidgetItemIterator``, and
+       ``tree.setCurrentItem()`` cannot reach them, and ``item_xref``
+       has no entries for them.  Expand the branch first
+       (``item.setExpanded(True)``) to build its items.
     """
 
     ui_file = "param_tree.ui"
 
     def __init__(self, parent, parameters={}, headings=["heading"], **kwargs):
-        from .utils import myLoadUi
-
         self.parent = parent
         self.parameters = parameters
 
@@ -41,22 +50,42 @@ class ParameterTree(QtWidgets.QDialog):
     def setup(self, headings):
         self.tree.setColumnCount(len(headings))
         self.tree.setHeaderLabels(headings)
-        self.tree.setSortingEnabled(True)
         self.splitter.setStretchFactor(1, 1)  # only self.pane (the editor)
         self.item_xref = {}  # connect subtree item with ParmsDict
+        self.item_pending = {}  # subtrees to be built when first expanded
         self.last_item = None  # to reset item selection if needed
 
-        def build_subtree(parent, subparms):
-            if not self.isParmsDict(subparms):
-                for k, v in subparms.items():
-                    uid = str(uuid4())
-                    self.item_xref[uid] = v if self.isParmsDict(v) else None
-                    item = QtWidgets.QTreeWidgetItem(parent, [k, uid])
-                    build_subtree(item, v)
+        # Populate first, then sort once and repaint once.
+        self.tree.setUpdatesEnabled(False)
+        if not self.isParmsDict(self.parameters):
+            self.tree.addTopLevelItems(self.build_items(self.parameters))
+        self.tree.setSortingEnabled(True)
+        self.tree.setUpdatesEnabled(True)
 
-        build_subtree(self.tree, self.parameters)
+        self.tree.itemExpanded.connect(self.expand)
         self.tree.itemSelectionChanged.connect(self.select)
 
+    def build_items(self, subparms):
+        """
+        Return tree items for one level of the 'subparms' hierarchy.
+
+        Deeper levels are not built until their parent item is expanded.
+        """
+        items = []
+        for k, v in subparms.items():
+            uid = str(uuid4())
+            item = QtWidgets.QTreeWidgetItem()
+            item.setText(0, k)
+            item.setText(1, uid)
+            if self.isParmsDict(v):
+                self.item_xref[uid] = v
+            else:
+                self.item_xref[uid] = None
+                self.item_pending[uid] = v
+                item.setChildIndicatorPolicy(QtWidgets.QTreeWidgetItem.ShowIndicator)
+            items.append(item)
+        return items
+
     def closeEvent(self, event):
         """Do not allow dialog to be closed if editor has unresolved changes."""
         if self.dirty():
@@ -75,12 +104,19 @@ class ParameterTree(QtWidgets.QDialog):
     def isParmsDict(self, obj):
         """Is 'obj' a dictionary of Parameter Items?"""
         if isinstance(obj, dict):
-            for v in obj.values():
-                if not isinstance(v, ParameterItemBase):
-                    return False
-            return True
+            return all(isinstance(v, ParameterItemBase) for v in obj.values())
         return False
 
+    @QtCore.pyqtSlot(QtWidgets.QTreeWidgetItem)
+    def expand(self, item):
+        """User expanded an item from the tree.  Build its children the first time."""
+        subparms = self.item_pending.pop(item.text(1), None)
+        if subparms is not None:
+            item.addChildren(self.build_items(subparms))
+            # Children are built now, Qt can decide about the indicator.
+            item.setChildIndicatorPolicy(QtWidgets.QTreeWidgetItem.DontShowIndicatorWhenChildless)
+
+    @QtCore.pyqtSlot()
     def select(self):
         """User selected an item from the tree."""
         item = self.tree.currentItem()
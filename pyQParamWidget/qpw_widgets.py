@@ -33,8 +33,8 @@ provide a way for users to input values for various parameters.
 
 from PyQt5 import QtWidgets
 
-UNDEFINED_VALUE = object
-"""For comparison with user input, avoids comparison with an explicit value."""
+UNDEFINED_VALUE = object()
+"""For comparison (with ``is``) with user input, avoids comparison with an explicit value."""
 
 
 class QPW_Mixin:
@@ -55,9 +55,19 @@ class QPW_Mixin:
     original_type = UNDEFINED_VALUE
     """Python object type to cast widget values."""
 
+    qpw_widget_type = UNDEFINED_VALUE
+    """Python object type returned by the Qt widget's value getter."""
+
+    qpw_convert = UNDEFINED_VALUE
+    """Cast for widget values, ``None`` if widget already returns ``original_type``."""
+
     def __init__(self, *args, parameter=None, **kwargs):
         self.parameter = parameter
         self.original_type = type(parameter.value)
+        if self.original_type is self.qpw_widget_type:
+            self.qpw_convert = None
+        else:
+            self.qpw_convert = self.original_type
         super().__init__(*args, **kwargs)
 
     def qpw_isChanged(self):
@@ -82,6 +92,8 @@ class QPW_Mixin:
         - slot (obj): Function (Qt slot) to call when widget value changes.
           Connect signal and slot in a subclass as needed since each widget
           class has a different name for the signal to be used.
+          Connect *after* this method sets the initial value, so that
+          setting it does not call the slot.
         """
         if pitem.tooltip != "":
             self.setToolTip(pitem.tooltip)
@@ -102,7 +114,7 @@ class QPW_CheckBox(QPW_Mixin, QtWidgets.QCheckBox):
 
     def qpw_get(self):
         """Return the value from the widget."""
-        return self.original_type(self.checkState())
+        return self.qpw_convert(self.checkState())  # Qt.CheckState is never the original type
 
     def qpw_set(self, value):
         """Set the widget's value."""
@@ -110,8 +122,8 @@ class QPW_CheckBox(QPW_Mixin, QtWidgets.QCheckBox):
 
     def qpw_setup(self, pitem, slot):
         self.setTristate(on=False)
-        self.stateChanged.connect(slot)
         super().qpw_setup(pitem, slot)
+        self.stateChanged.connect(slot)
 
 
 class QPW_Choice(QPW_Mixin, QtWidgets.QComboBox):
@@ -126,9 +138,14 @@ class QPW_Choice(QPW_Mixin, QtWidgets.QComboBox):
        ~qpw_setup
     """
 
+    qpw_widget_type = str
+
     def qpw_get(self):
         """Return the value from the widget."""
-        return self.original_type(self.currentText())
+        text = self.currentText()
+        if self.qpw_convert is None:
+            return text
+        return self.qpw_convert(text)
 
     def qpw_set(self, value):
         """Set the widget's value."""
@@ -136,8 +153,8 @@ class QPW_Choice(QPW_Mixin, QtWidgets.QComboBox):
 
     def qpw_setup(self, pitem, slot):
         self.addItems(pitem.choices)
-        self.currentTextChanged.connect(slot)
         super().qpw_setup(pitem, slot)
+        self.currentTextChanged.connect(slot)
 
 
 class QPW_SpinBox(QPW_Mixin, QtWidgets.QSpinBox):
@@ -152,9 +169,14 @@ class QPW_SpinBox(QPW_Mixin, QtWidgets.QSpinBox):
        ~qpw_setup
     """
 
+    qpw_widget_type = int
+
     def qpw_get(self):
         """Return the value from the widget."""
-        return self.original_type(self.value())
+        value = self.value()
+        if self.qpw_convert is None:
+            return value
+        return self.qpw_convert(value)
 
     def qpw_set(self, value):
         """Set the widget's value."""
@@ -162,8 +184,8 @@ class QPW_SpinBox(QPW_Mixin, QtWidgets.QSpinBox):
 
     def qpw_setup(self, pitem, slot):
         self.setRange(pitem.lo, pitem.hi)
-        self.valueChanged.connect(slot)
         super().qpw_setup(pitem, slot)
+        self.valueChanged.connect(slot)
 
 
 class QPW_Text(QPW_Mixin, QtWidgets.QLineEdit):
@@ -178,17 +200,22 @@ class QPW_Text(QPW_Mixin, QtWidgets.QLineEdit):
        ~qpw_setup
     """
 
+    qpw_widget_type = str
+
     def qpw_get(self):
         """Return the value from the widget."""
-        return self.original_type(self.text())
+        text = self.text()
+        if self.qpw_convert is None:
+            return text
+        return self.qpw_convert(text)
 
     def qpw_set(self, value):
         """Set the widget's value."""
         self.setText(str(value))
 
     def qpw_setup(self, pitem, slot):
-        self.textChanged.connect(slot)
         super().qpw_setup(pitem, slot)
+        self.textChanged.connect(slot)
 
 
 # -----------------------------------------------------------------------------
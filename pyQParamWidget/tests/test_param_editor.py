@@ -0,0 +1,108 @@
+"""Test the ParameterEditor dirty tracking."""
+
+import pytest
+
+from ..param_editor import ParameterEditor
+from ..param_item import ParameterItemCheckbox
+from ..param_item import ParameterItemChoice
+from ..param_item import ParameterItemSpinBox
+from ..param_item import ParameterItemText
+
+
+def make_parameters():
+    return {
+        "text": ParameterItemText("text", "hello"),
+        "choice": ParameterItemChoice("choice", "", choices=["", "red", "blue"]),
+        "check": ParameterItemCheckbox("check", True),
+        "spin": ParameterItemSpinBox("spin", 5, lo=1, hi=10),
+    }
+
+
+@pytest.fixture
+def editor(qtbot, monkeypatch):
+    # A dirty editor shows a modal dialog when qtbot closes it.
+    monkeypatch.setattr(
+        "pyQParamWidget.param_editor.unsaved_changes_alert_dialog",
+        lambda parent: None,
+    )
+    widget = ParameterEditor(None, make_parameters())
+    qtbot.addWidget(widget)
+    return widget
+
+
+# Qt setter and (new, original) widget value for each editor
+EDITS = {
+    "text": ("setText", "bye", "hello"),
+    "choice": ("setCurrentText", "red", ""),
+    "check": ("setCheckState", 0, 2),
+    "spin": ("setValue", 7, 5),
+}
+
+
+def assert_clean(editor):
+    assert not editor.dirty()
+    assert editor.changedValues() == {}
+    assert editor._changed == {}
+    assert not editor.btn_accept.isEnabled()
+    assert not editor.btn_reset.isEnabled()
+
+
+def test_initial(editor):
+    assert_clean(editor)
+    assert editor.values() == {"text": "hello", "choice": "", "check": True, "spin": 5}
+
+
+@pytest.mark.parametrize("key", list(EDITS))
+def test_edit_and_edit_back(editor, key):
+    setter, new, original = EDITS[key]
+    getattr(editor.editors[key], setter)(new)
+    assert editor.dirty()
+    assert list(editor.changedValues()) == [key]
+    assert editor.btn_accept.isEnabled()
+    assert editor.btn_reset.isEnabled()
+
+    getattr(editor.editors[key], setter)(original)
+    assert_clean(editor)
+
+
+def test_changed_values_in_parameter_order(editor):
+    for key in reversed(list(EDITS)):
+        setter, new, _original = EDITS[key]
+        getattr(editor.editors[key], setter)(new)
+    assert list(editor.changedValues()) == list(EDITS)
+
+    editor.do_reset()
+    assert_clean(editor)
+
+
+def test_accept(editor):
+    editor.editors["spin"].setValue(9)
+    editor.editors["text"].setText("bye")
+    editor.do_accept()
+    assert_clean(editor)
+    assert editor.parameters["spin"].value == 9
+    assert editor.parameters["text"].value == "bye"
+
+    editor.editors["spin"].setValue(5)  # compared with the accepted value now
+    assert editor.changedValues() == {"spin": 5}
+
+    editor.do_reset()
+    assert_clean(editor)
+
+
+def test_reset(editor):
+    editor.editors["spin"].setValue(9)
+    editor.editors["check"].setCheckState(0)
+    editor.do_reset()
+    assert_clean(editor)
+    assert editor.values()["spin"] == 5
+    assert editor.values()["check"] is True
+
+
+def test_setup_does_not_call_change_handler(qtbot, monkeypatch):
+    calls = []
+    monkeypatch.setattr(ParameterEditor, "_onEditorChanged", lambda *args: calls.append(args))
+    widget = ParameterEditor(None, make_parameters())
+    qtbot.addWidget(widget)
+    assert calls == []
+    assert_clean(widget)
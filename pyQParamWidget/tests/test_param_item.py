@@ -0,0 +1,64 @@
+"""Test the ParameterItem constructors."""
+
+import pytest
+
+from ..param_item import ParameterItemCheckbox
+from ..param_item import ParameterItemChoice
+from ..param_item import ParameterItemSpinBox
+from ..param_item import ParameterItemText
+
+
+@pytest.mark.parametrize(
+    "factory, expected",
+    [
+        [lambda: ParameterItemCheckbox("a", True, "tip"), dict(value=True, tooltip="tip")],
+        [lambda: ParameterItemChoice("a", "x", ["x", "y"]), dict(value="x", choices=["x", "y"])],
+        [lambda: ParameterItemChoice("a", "x"), dict(value="x", choices=[])],
+        [lambda: ParameterItemChoice("a", "x", choices=["x"], tooltip="tip"), dict(tooltip="tip")],
+        [lambda: ParameterItemSpinBox("a", 3, 10, 0), dict(value=3, hi=10, lo=0)],
+        [lambda: ParameterItemSpinBox("a", 3, lo=0, hi=10, tooltip="tip"), dict(tooltip="tip")],
+        [lambda: ParameterItemText("a", "x", "tip"), dict(value="x", tooltip="tip")],
+    ],
+)
+def test_accepted(factory, expected):
+    item = factory()
+    assert item.label == "a"
+    for k, v in expected.items():
+        assert getattr(item, k) == v
+
+
+@pytest.mark.parametrize(
+    "factory, exception, match",
+    [
+        [lambda: ParameterItemCheckbox("a", True, hi=3), TypeError, "hi"],
+        [lambda: ParameterItemText("a", "x", choices=["x"]), TypeError, "choices"],
+        [lambda: ParameterItemText("a", "x", lo=0), TypeError, "lo"],
+        [lambda: ParameterItemChoice("a", "x", hi=3), TypeError, "hi"],
+        [lambda: ParameterItemChoice("a", "x", choices=None), ValueError, "choices"],
+        [lambda: ParameterItemSpinBox("a", 3, lo=0), ValueError, "hi"],
+        [lambda: ParameterItemSpinBox("a", 3, hi=10), ValueError, "lo"],
+        [lambda: ParameterItemSpinBox("a", 3, hi=0, lo=10), ValueError, "greater than"],
+        [lambda: ParameterItemSpinBox("a", 11, hi=10, lo=0), ValueError, "greater than"],
+        [lambda: ParameterItemSpinBox("a", -1, hi=10, lo=0), ValueError, "less than"],
+    ],
+)
+def test_rejected(factory, exception, match):
+    with pytest.raises(exception, match=match):
+        factory()
+
+
+def test_no_instance_dict():
+    assert not hasattr(ParameterItemText("a", "x"), "__dict__")
+
+
+def test_subclass_validate_is_called():
+    class NonEmpty(ParameterItemText):
+        __slots__ = ()
+
+        def validate(self):
+            if self.value == "":
+                raise ValueError("Must not be empty")
+
+    assert NonEmpty("a", "x").value == "x"
+    with pytest.raises(ValueError, match="empty"):
+        NonEmpty("a", "")
@@ -0,0 +1,77 @@
+"""Test that ParameterTree builds its branches when they are first expanded."""
+
+import pytest
+from PyQt5 import QtCore
+from PyQt5 import QtWidgets
+
+from ..param_item import ParameterItemCheckbox
+from ..param_item import ParameterItemText
+from ..param_tree import ParameterTree
+
+
+def make_parameters():
+    return {
+        "apps": {
+            "other": {"demo": ParameterItemCheckbox("demo", True)},
+            "tiled": {"server": {"url": ParameterItemText("url", "localhost")}},
+        },
+        "UI": {"plotting": {"title": ParameterItemText("title", "hello")}},
+        "empty": {},
+    }
+
+
+@pytest.fixture
+def dialog(qtbot):
+    widget = ParameterTree(None, make_parameters(), headings=["heading", "uid"])
+    qtbot.addWidget(widget)
+    return widget
+
+
+def top_level(tree):
+    return {tree.topLevelItem(i).text(0): tree.topLevelItem(i) for i in range(tree.topLevelItemCount())}
+
+
+def children(item):
+    return [item.child(i).text(0) for i in range(item.childCount())]
+
+
+def test_setup_builds_top_level_only(dialog):
+    items = top_level(dialog.tree)
+    assert sorted(items) == ["UI", "apps", "empty"]
+    assert all(item.childCount() == 0 for item in items.values())
+    assert sorted(dialog.item_xref) == sorted(item.text(1) for item in items.values())
+    assert sorted(dialog.item_pending) == sorted([items["apps"].text(1), items["UI"].text(1)])
+    assert dialog.tree.findItems("tiled", QtCore.Qt.MatchRecursive) == []
+
+
+def test_expand_builds_one_level(dialog):
+    apps = top_level(dialog.tree)["apps"]
+    assert apps.childIndicatorPolicy() == QtWidgets.QTreeWidgetItem.ShowIndicator
+
+    apps.setExpanded(True)
+    assert apps.text(1) not in dialog.item_pending
+    assert children(apps) == ["tiled", "other"]  # sorted, like the top level
+    assert all(apps.child(i).childCount() == 0 for i in range(apps.childCount()))
+    tiled, other = apps.child(0), apps.child(1)
+    assert tiled.text(1) in dialog.item_pending
+    assert other.text(1) not in dialog.item_pending
+    assert dialog.item_xref[other.text(1)] is dialog.parameters["apps"]["other"]
+
+    apps.setExpanded(False)
+    apps.setExpanded(True)  # built only once
+    assert children(apps) == ["tiled", "other"]
+
+
+def test_empty_section_is_selectable_leaf(dialog):
+    empty = top_level(dialog.tree)["empty"]
+    assert empty.childIndicatorPolicy() == QtWidgets.QTreeWidgetItem.DontShowIndicatorWhenChildless
+    assert empty.text(1) not in dialog.item_pending
+
+    dialog.tree.setCurrentItem(empty)
+    assert dialog.pane.values() == {}
+
+
+def test_sort_order(dialog):
+    tree = dialog.tree
+    assert [tree.topLevelItem(i).text(0) for i in range(tree.topLevelItemCount())] == ["empty", "apps", "UI"]
+    assert tree.header().sortIndicatorOrder() == QtCore.Qt.DescendingOrder
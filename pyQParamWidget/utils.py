@@ -10,6 +10,7 @@ Utility functions.
 import pathlib
 
 from PyQt5 import QtWidgets
+from PyQt5 import uic
 
 ROOT_PATH = pathlib.Path(__file__).parent
 
@@ -18,8 +19,6 @@ def myLoadUi(ui_file, baseinstance=None, **kw):
     """
     Load a ``.ui`` file for use in building a GUI.
     """
-    from PyQt5 import uic
-
     if isinstance(ui_file, str):
         ui_file = ROOT_PATH / ui_file
 